@@ -0,0 +1,118 @@
+"""
+Vectorized course analytics over columns pulled from the database in one
+query each (see the Analytics section of app.py). Everything here works
+on NumPy arrays; nothing touches the database.
+"""
+import numpy as np
+
+PERCENTILES = (10, 25, 50, 75, 90)
+COMPONENTS = ("ia1", "ia2", "ia3", "total", "average", "best_two")
+
+
+def to_columns(rows, dtypes):
+    """Transpose result rows into one array per column."""
+    if not rows:
+        return [np.empty(0, dtype=d) for d in dtypes]
+    return [np.asarray(col, dtype=d) for col, d in zip(zip(*rows), dtypes)]
+
+
+def _num(value, places=2):
+    value = float(value)
+    return round(value, places) if np.isfinite(value) else None
+
+
+def component(ia1, ia2, ia3, name):
+    """One mark per result row: an IA, their total/average, or best two of three."""
+    marks = np.stack([ia1, ia2, ia3]).astype(float)
+    if name in ("ia1", "ia2", "ia3"):
+        return marks[int(name[-1]) - 1]
+    if name == "total":
+        return marks.sum(axis=0)
+    if name == "average":
+        return marks.mean(axis=0)
+    if name == "best_two":
+        return (marks.sum(axis=0) - marks.min(axis=0)) / 2
+    raise ValueError(f"unknown component {name}")
+
+
+def describe(values):
+    if values.size == 0:
+        return {"count": 0, "mean": None, "std": None, "min": None, "max": None,
+                "percentiles": {str(p): None for p in PERCENTILES}}
+    points = np.percentile(values, PERCENTILES)
+    return {
+        "count": int(values.size),
+        "mean": _num(values.mean()),
+        "std": _num(values.std()),
+        "min": _num(values.min()),
+        "max": _num(values.max()),
+        "percentiles": {str(p): _num(v) for p, v in zip(PERCENTILES, points)},
+    }
+
+
+def histogram(values, bins):
+    if values.size == 0:
+        return {"edges": [], "counts": []}
+    counts, edges = np.histogram(values, bins=bins)
+    return {"edges": [_num(e) for e in edges], "counts": counts.tolist()}
+
+
+def group_stats(keys, values):
+    """{key: {count, mean, std}} for each distinct key, via bincount."""
+    labels, idx = np.unique(keys, return_inverse=True)
+    n = np.bincount(idx, minlength=labels.size)
+    total = np.bincount(idx, weights=values, minlength=labels.size)
+    squares = np.bincount(idx, weights=values * values, minlength=labels.size)
+    mean = total / n
+    std = np.sqrt(np.maximum(squares / n - mean * mean, 0.0))
+    return {
+        str(label): {"count": int(c), "mean": _num(m), "std": _num(s)}
+        for label, c, m, s in zip(labels, n, mean, std)
+    }
+
+
+def attendance_by_student(student_ids, present, total):
+    """Sum present/total per student: (ids, present, total, percentage)."""
+    ids, idx = np.unique(student_ids, return_inverse=True)
+    p = np.bincount(idx, weights=present, minlength=ids.size)
+    t = np.bincount(idx, weights=total, minlength=ids.size)
+    pct = np.divide(100 * p, t, out=np.zeros_like(p), where=t > 0)
+    return ids, p, t, pct
+
+
+def at_risk(student_ids, present, total, threshold):
+    """Students below `threshold` percent attendance, lowest first."""
+    ids, p, t, pct = attendance_by_student(student_ids, present, total)
+    mask = (t > 0) & (pct < threshold)
+    order = np.argsort(pct[mask], kind="stable")
+    return ids[mask][order], p[mask][order], t[mask][order], pct[mask][order]
+
+
+def correlations(student_ids, subjects, values):
+    """
+    Pearson r between every pair of subjects, each pair over the students
+    who have a mark in both. Returns (subjects, r matrix, pair counts);
+    pairs with fewer than 2 students or no variance are NaN.
+    """
+    _, row = np.unique(student_ids, return_inverse=True)
+    labels, col = np.unique(subjects, return_inverse=True)
+    x = np.zeros((row.max() + 1 if row.size else 0, labels.size))
+    seen = np.zeros_like(x)
+    x[row, col] = values  # duplicate (student, subject) rows: last one wins
+    seen[row, col] = 1.0
+
+    # pairwise-complete sums as matrix products: [i, j] is over students with both
+    n = seen.T @ seen
+    sx = x.T @ seen
+    sxx = (x * x).T @ seen
+    sxy = x.T @ x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sx.T / n
+        var = sxx - sx * sx / n
+        r = cov / np.sqrt(var * var.T)
+    r[(n < 2) | ~np.isfinite(r)] = np.nan
+    return labels, r, n
+
+
+def matrix_to_list(matrix, places=4):
+    return [[_num(v, places) for v in row] for row in matrix]
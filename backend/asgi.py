@@ -0,0 +1,132 @@
+"""
+ASGI entry point for high-concurrency windows (roll call, login bursts):
+
+    cd backend
+    pip install -r requirements-asgi.txt
+    uvicorn asgi:application --workers 2
+
+The two burst endpoints, GET /api/auth/me and POST /api/attendance/, are
+async handlers. They run the same code as app.py (current_profile,
+save_attendance) on the same models, through AsyncSession.run_sync over an
+async driver (aiomysql for MySQL, aiosqlite for SQLite), so a slow commit
+parks a coroutine instead of a worker thread. Every other route is the
+Flask app, served on asgiref's thread pool.
+
+ASYNC_DATABASE_URL overrides the async URL derived from DATABASE_URL.
+"""
+import contextlib
+import os
+import time
+
+from asgiref.wsgi import WsgiToAsgi
+from flask_jwt_extended import decode_token
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
+
+from app import (
+    STICKY_COOKIE, app, attendance_flusher, current_profile, db, engine_options,
+    metrics, replica_router, save_attendance,
+)
+
+ASYNC_DRIVERS = {"mysql+pymysql": "mysql+aiomysql", "mysql": "mysql+aiomysql",
+                 "sqlite": "sqlite+aiosqlite"}
+
+
+def async_url(url):
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+ASYNC_DATABASE_URL = os.environ.get("ASYNC_DATABASE_URL") or async_url(
+    app.config["SQLALCHEMY_DATABASE_URI"]
+)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+
+
+async def run_in_session(fn, *args):
+    """
+    Run sync `fn(*args)` inside an app context with db.session (and so
+    Model.query) bound to an AsyncSession's sync facade. Each asyncio task
+    has its own app context, so concurrent requests get separate sessions.
+    """
+    with app.app_context():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            db.session.registry.set(session.sync_session)
+            try:
+                return await session.run_sync(lambda _: fn(*args))
+            finally:
+                db.session.registry.clear()
+
+
+def bearer_claims(request, optional):
+    """(claims, error response) for the Authorization header, like @jwt_required."""
+    header = request.headers.get("authorization", "")
+    if not header:
+        if optional:
+            return None, None
+        return None, JSONResponse({"msg": "Missing Authorization Header"}, 401)
+    scheme, _, token = header.partition(" ")
+    if scheme != "Bearer" or not token:
+        return None, JSONResponse({"msg": "Bad Authorization header. Expected 'Bearer <JWT>'"}, 422)
+    try:
+        with app.app_context():
+            return decode_token(token), None
+    except Exception as exc:
+        return None, JSONResponse({"msg": str(exc)}, 401)
+
+
+def respond(endpoint, started, body, status):
+    response = JSONResponse(body, status, headers={"Access-Control-Allow-Origin": "*"})
+    # SQL counts aren't tracked per coroutine; they show as 0 for these endpoints
+    metrics.observe(endpoint, status, time.perf_counter() - started, 0, 0.0,
+                    len(response.body))
+    return response
+
+
+async def me(request):
+    started = time.perf_counter()
+    claims, error = bearer_claims(request, optional=False)
+    if error:
+        return error
+    body, status = await run_in_session(
+        current_profile, claims.get(app.config["JWT_IDENTITY_CLAIM"]), claims
+    )
+    return respond("me", started, body, status)
+
+
+async def submit_attendance(request):
+    started = time.perf_counter()
+    _, error = bearer_claims(request, optional=True)
+    if error:
+        return error
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+    body, status = await run_in_session(save_attendance, data or {})
+    response = respond("submit_attendance", started, body, status)
+    if replica_router.keys and status < 400:
+        sticky = app.config["DB_STICKY_SECONDS"]
+        response.set_cookie(STICKY_COOKIE, f"{time.time() + sticky:.3f}", max_age=sticky,
+                            httponly=True, samesite="lax")
+    return response
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_):
+    attendance_flusher.ensure_started()  # replay batches left pending by a restart
+    yield
+    await async_engine.dispose()
+
+
+application = Starlette(
+    routes=[
+        Route("/api/auth/me", me, methods=["GET"]),
+        Route("/api/attendance/", submit_attendance, methods=["POST"]),
+        # everything else (and other methods on the paths above) -> Flask
+        Mount("/", app=WsgiToAsgi(app)),
+    ],
+    lifespan=lifespan,
+)
@@ -0,0 +1,25 @@
+"""
+Benchmark suite for the API in app.py.
+
+    cd backend
+    export BENCH_DATABASE_URL=sqlite:////tmp/bench.db   # throwaway; or a scratch MySQL
+    python -m bench seed --students 50000 --days 200
+    python -m bench run --requests 5000 --save-baseline bench_baseline.json
+    python -m bench run --requests 5000 --baseline bench_baseline.json
+    python -m bench compare-modes --requests 5000 --concurrency 200 --students 50000 --days 200
+    python -m bench json --repeat 20
+
+Every command refuses to run without BENCH_DATABASE_URL (used in place
+of DATABASE_URL), so the suite can't wipe the app's real database.
+`seed` fills the database with synthetic courses, users, students,
+attendance, results and leave requests. `run` replays a weighted mix of
+login / dashboard / roll-call / results traffic through the Flask test
+client and reports latency percentiles, throughput and SQL queries per
+request per operation; with --baseline it exits 1 on a regression.
+`compare-modes` sends a roll-call burst (/me checks and attendance
+submissions) through the WSGI app and the ASGI server (asgi.py) and
+prints both reports side by side; it reseeds the database (same options
+as `seed`) before each mode so both start from identical data. `json`
+times the students/results lists under each encoding path (ORM dicts +
+stdlib json, column rows + stdlib, + orjson, ?shape=rows, + gzip).
+"""
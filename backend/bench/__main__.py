@@ -0,0 +1,88 @@
+import argparse
+import json
+import os
+import sys
+
+# seed drops every table and run writes attendance: the suite only ever
+# talks to BENCH_DATABASE_URL, never to whatever DATABASE_URL the app uses
+if os.environ.get("BENCH_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["BENCH_DATABASE_URL"]
+
+from . import seed as seed_mod
+from . import serialization
+from . import workload
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench", description="API benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_seed = sub.add_parser("seed", help="drop, recreate and fill the database")
+
+    p_run = sub.add_parser("run", help="replay the request mix and report")
+    p_run.add_argument("--requests", type=int, default=2000)
+    p_run.add_argument("--concurrency", type=int, default=1)
+    p_run.add_argument("--mix", help='JSON weights, e.g. \'{"login": 1, "auth_me": 5}\'')
+    p_run.add_argument("--json", dest="json_out", help="write the full report here")
+    p_run.add_argument("--baseline", help="fail if results regress past this report")
+    p_run.add_argument("--save-baseline", help="store this run as the new baseline")
+    p_run.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 slowdown")
+
+    p_cmp = sub.add_parser("compare-modes", help="roll-call burst through WSGI and ASGI, side by side "
+                                                 "(reseeds the database before each mode)")
+    p_cmp.add_argument("--requests", type=int, default=2000)
+    p_cmp.add_argument("--concurrency", type=int, default=100, help="ASGI client coroutines")
+    p_cmp.add_argument("--wsgi-threads", type=int, default=8)
+    p_cmp.add_argument("--mix", help="JSON weights (default: auth_me + attendance_submit)")
+    p_cmp.add_argument("--json", dest="json_out", help="write both reports here")
+    for p in (p_seed, p_cmp):
+        p.add_argument("--students", type=int, default=1000)
+        p.add_argument("--courses", type=int, default=10)
+        p.add_argument("--days", type=int, default=60, help="weekdays of attendance")
+        p.add_argument("--leave-ratio", type=float, default=0.1)
+
+    p_json = sub.add_parser("json", help="serialization cost of the large list endpoints")
+    p_json.add_argument("--repeat", type=int, default=10)
+
+    args = parser.parse_args(argv)
+    seed_mod.check_disposable()
+
+    if args.command == "seed":
+        shape = seed_mod.seed(args.students, args.courses, args.days, args.leave_ratio)
+        print("Seeded:", json.dumps(shape))
+        return 0
+
+    if args.command == "json":
+        print(serialization.format_report(serialization.run(args.repeat)))
+        return 0
+
+    mix = json.loads(args.mix) if args.mix else None
+    if args.command == "compare-modes":
+        seed_args = {"students": args.students, "courses": args.courses, "days": args.days,
+                     "leave_ratio": args.leave_ratio}
+        reports = workload.compare_modes(args.requests, args.concurrency, args.wsgi_threads, mix,
+                                         seed_args)
+        print(workload.format_comparison(reports))
+        if args.json_out:
+            workload.save_baseline(reports, args.json_out)
+        return 0
+
+    report = workload.run(args.requests, args.concurrency, mix)
+    print(workload.format_report(report))
+
+    if args.json_out:
+        workload.save_baseline(report, args.json_out)
+    if args.save_baseline:
+        workload.save_baseline(report, args.save_baseline)
+
+    if args.baseline:
+        failures = workload.compare(report, workload.load_baseline(args.baseline), args.tolerance)
+        for failure in failures:
+            print("REGRESSION", failure)
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Synthetic data generator for the benchmark database."""
+import os
+import random
+from datetime import date, timedelta
+
+from werkzeug.security import generate_password_hash
+
+from app import (
+    app, db, AttendanceRecord, Course, LeaveRequest, Result, Student, Subject, User,
+    rebuild_attendance_rollups,
+)
+
+BENCH_PASSWORD = "password123"
+BATCH = 10000
+SUBJECTS = ["Mathematics", "Physics", "Chemistry", "Programming", "Electronics", "English"]
+
+
+def insert_batches(table, rows):
+    """executemany `rows` (any iterable of dicts) in BATCH-sized chunks."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH:
+            db.session.execute(table.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(table.insert(), batch)
+
+
+def check_disposable():
+    """Exit unless the app is connected to the database named by BENCH_DATABASE_URL."""
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if not url:
+        raise SystemExit("Set BENCH_DATABASE_URL to a throwaway database: "
+                         "the benchmark drops and refills every table.")
+    if url != app.config["SQLALCHEMY_DATABASE_URI"]:
+        raise SystemExit("The app is not connected to BENCH_DATABASE_URL; refusing to touch it.")
+
+
+def seed(students=1000, courses=10, days=60, leave_ratio=0.1, start=date(2025, 1, 6), rng_seed=42):
+    """
+    Create a fresh dataset: `students` students spread over `courses`
+    courses, one attendance row per student per weekday for `days`
+    weekdays, IA results for every subject and a few leave requests.
+    All users share BENCH_PASSWORD (hashed once).
+    """
+    check_disposable()
+    rng = random.Random(rng_seed)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        db.session.execute(Course.__table__.insert(), [
+            {"id": c + 1, "name": f"Course {c + 1}", "code": f"C{c + 1}"} for c in range(courses)
+        ])
+        db.session.execute(Subject.__table__.insert(), [
+            {"name": name, "course_name": f"Course {c + 1}", "staff_name": f"Staff {c + 1}"}
+            for c in range(courses) for name in SUBJECTS
+        ])
+
+        password_hash = generate_password_hash(BENCH_PASSWORD)
+        insert_batches(User.__table__, (
+            {"id": i, "full_name": f"Student {i}", "email": f"student{i}@bench.local",
+             "username": f"student{i}@bench.local", "password_hash": password_hash,
+             "role": "student"}
+            for i in range(1, students + 1)
+        ))
+        insert_batches(Student.__table__, (
+            {"id": i, "user_id": i, "course_id": (i % courses) + 1}
+            for i in range(1, students + 1)
+        ))
+
+        weekdays = []
+        d = start
+        while len(weekdays) < days:
+            if d.weekday() < 5:
+                weekdays.append(d)
+            d += timedelta(days=1)
+
+        insert_batches(AttendanceRecord.__table__, (
+            {"date": day, "course_id": (sid % courses) + 1, "student_id": sid,
+             "status": "present" if rng.random() < 0.85 else "absent"}
+            for day in weekdays for sid in range(1, students + 1)
+        ))
+        insert_batches(Result.__table__, (
+            {"student_id": sid, "subject_name": name, "ia1": rng.randint(5, 25),
+             "ia2": rng.randint(5, 25), "ia3": rng.randint(5, 25), "attendance": rng.randint(60, 100)}
+            for sid in range(1, students + 1) for name in SUBJECTS
+        ))
+        insert_batches(LeaveRequest.__table__, (
+            {"student_id": sid, "reason": "bench", "from_date": weekdays[0],
+             "to_date": weekdays[0] + timedelta(days=1),
+             "status": rng.choice(["pending", "approved", "rejected"])}
+            for sid in range(1, students + 1) if rng.random() < leave_ratio
+        ))
+        db.session.commit()
+
+        rebuild_attendance_rollups()
+
+    return {"students": students, "courses": courses, "attendance_days": len(weekdays),
+            "attendance_rows": students * len(weekdays)}
@@ -0,0 +1,84 @@
+"""JSON serialization microbenchmark for the large list endpoints."""
+import json
+import statistics
+import time
+
+from sqlalchemy.orm import contains_eager
+
+from app import app, db, Result, Student, User, result_to_dict, student_to_dict
+
+ENDPOINTS = ("/api/students/", "/api/results/")
+
+
+def orm_baseline(path):
+    """
+    The pre-Row implementation: ORM objects + *_to_dict + stdlib json.
+    Runs without the WSGI round trip, so it slightly flatters the baseline.
+    """
+    if path == "/api/students/":
+        rows = (Student.query.join(User).outerjoin(Student.course)
+                .options(contains_eager(Student.user), contains_eager(Student.course)).all())
+        items = [student_to_dict(s) for s in rows]
+    else:
+        rows = (Result.query.join(Student).join(User)
+                .options(contains_eager(Result.student).contains_eager(Student.user)).all())
+        items = [result_to_dict(r) for r in rows]
+    body = json.dumps(items, sort_keys=True, separators=(",", ":")).encode()
+    db.session.remove()
+    return body
+
+
+def timed(fn, repeat):
+    samples, size = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(statistics.median(samples), 3),
+            "min_ms": round(min(samples), 3), "bytes": size}
+
+
+def run(repeat=10):
+    """{endpoint: {variant: {median_ms, min_ms, bytes}}} for each encoding path."""
+    client = app.test_client()
+    provider = app.json
+    has_orjson = provider.use_orjson
+    gzip_min = app.config["JSON_GZIP_MIN_BYTES"]
+
+    def get(url, gzip=False):
+        headers = {"Accept-Encoding": "gzip"} if gzip else {}
+        return lambda: len(client.get(url, headers=headers).get_data())
+
+    report = {}
+    try:
+        for path in ENDPOINTS:
+            variants = {}
+            with app.test_request_context():
+                variants["orm+stdlib"] = timed(lambda: len(orm_baseline(path)), repeat)
+
+            app.config["JSON_GZIP_MIN_BYTES"] = float("inf")
+            provider.use_orjson = False
+            variants["rows+stdlib"] = timed(get(path), repeat)
+            if has_orjson:
+                provider.use_orjson = True
+                variants["rows+orjson"] = timed(get(path), repeat)
+                variants["rows+orjson shape=rows"] = timed(get(path + "?shape=rows"), repeat)
+
+            app.config["JSON_GZIP_MIN_BYTES"] = gzip_min
+            variants["+gzip"] = timed(get(path, gzip=True), repeat)
+            report[path] = variants
+    finally:
+        provider.use_orjson = has_orjson
+        app.config["JSON_GZIP_MIN_BYTES"] = gzip_min
+    return report
+
+
+def format_report(report):
+    lines = [f"{'endpoint':<16}{'variant':<26}{'median ms':>11}{'min ms':>10}{'bytes':>12}{'speedup':>9}"]
+    for path, variants in report.items():
+        base = variants["orm+stdlib"]["median_ms"]
+        for name, m in variants.items():
+            speedup = f"{base / m['median_ms']:.2f}x" if m["median_ms"] else "-"
+            lines.append(f"{path:<16}{name:<26}{m['median_ms']:>11}{m['min_ms']:>10}"
+                         f"{m['bytes']:>12}{speedup:>9}")
+    return "\n".join(lines)
@@ -0,0 +1,306 @@
+"""Scripted request mix, latency/query accounting and baseline comparison."""
+import asyncio
+import contextvars
+import json
+import random
+import threading
+import time
+
+from sqlalchemy import event, func
+from sqlalchemy.engine import Engine
+
+import app as api
+from app import app, db, AttendanceRecord, Course, Student
+
+from . import seed as seed_mod
+from .seed import BENCH_PASSWORD
+
+# operation -> relative weight in the mix
+DEFAULT_MIX = {
+    "login": 10,
+    "auth_me": 30,
+    "stats_summary": 10,
+    "results_view": 25,
+    "student_profile": 10,
+    "students_page": 10,
+    "attendance_view": 10,
+    "attendance_submit": 5,
+    "course_analytics": 5,
+}
+# roll-call burst: staff submitting sections while students poll /me
+ROLL_CALL_MIX = {"auth_me": 3, "attendance_submit": 1}
+SECTION_SIZE = 120
+
+# statements issued by the current request; a context variable (not a
+# thread-local) so it also follows requests through the ASGI event loop
+_queries = contextvars.ContextVar("bench_queries", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = _queries.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def dataset_shape():
+    with app.app_context():
+        students = db.session.query(func.count(Student.id)).scalar() or 0
+        courses = db.session.query(func.count(Course.id)).scalar() or 0
+        first, last = db.session.query(
+            func.min(AttendanceRecord.date), func.max(AttendanceRecord.date)
+        ).one()
+    if not students or not courses or not first:
+        raise SystemExit("Database is empty: run `python -m bench seed` first.")
+    return {"students": students, "courses": courses, "first_date": first, "last_date": last}
+
+
+class Workload:
+    """Builds requests for each operation against a seeded dataset."""
+
+    def __init__(self, shape, rng):
+        self.shape = shape
+        self.rng = rng
+        self.days = (shape["last_date"] - shape["first_date"]).days
+
+    def student_id(self):
+        return self.rng.randint(1, self.shape["students"])
+
+    def some_date(self):
+        return (self.shape["first_date"]
+                + api.timedelta(days=self.rng.randint(0, self.days))).isoformat()
+
+    def request(self, op, token):
+        """(method, url, kwargs) for one operation."""
+        auth = {"headers": {"Authorization": f"Bearer {token}"}} if token else {}
+        if op == "login":
+            sid = self.student_id()
+            return "POST", "/api/auth/login", {"json": {
+                "username": f"student{sid}@bench.local", "password": BENCH_PASSWORD,
+            }}
+        if op == "auth_me":
+            return "GET", "/api/auth/me", auth
+        if op == "stats_summary":
+            return "GET", "/api/stats/summary", auth
+        if op == "results_view":
+            return "GET", f"/api/results/?student_id={self.student_id()}", auth
+        if op == "student_profile":
+            return "GET", f"/api/students/{self.student_id()}/profile", auth
+        if op == "students_page":
+            after = self.rng.randint(0, max(self.shape["students"] - 100, 0))
+            return "GET", f"/api/students/?limit=100&after={after}", auth
+        if op == "attendance_view":
+            course = self.rng.randint(1, self.shape["courses"])
+            return "GET", f"/api/attendance/?date={self.some_date()}&course=C{course}", auth
+        if op == "course_analytics":
+            course = self.rng.randint(1, self.shape["courses"])
+            return "GET", f"/api/analytics/marks?course=C{course}&component=ia2", auth
+        if op == "attendance_submit":
+            course = self.rng.randint(1, self.shape["courses"])
+            # seeded students belong to course (id % courses) + 1, so course C
+            # holds ids = C - 1 (mod courses); course 1 starts at id `courses`
+            ids = range(course - 1 or self.shape["courses"],
+                        self.shape["students"] + 1, self.shape["courses"])
+            records = [
+                {"student_id": sid, "status": "present" if self.rng.random() < 0.85 else "absent"}
+                for sid in list(ids)[:SECTION_SIZE]
+            ]
+            return "POST", "/api/attendance/", {"json": {
+                "date": self.some_date(), "course": f"C{course}", "records": records,
+            }}
+        raise ValueError(f"unknown operation {op}")
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def run(requests=2000, concurrency=1, mix=None, rng_seed=1):
+    """Replay `requests` operations over `concurrency` threads; returns the report."""
+    mix = mix or DEFAULT_MIX
+    shape = dataset_shape()
+
+    # measure server cost, not the login rate limiter
+    api.login_ip_limiter.capacity = api.login_account_limiter.capacity = float("inf")
+
+    ops, weights = zip(*mix.items())
+    samples = {op: [] for op in ops}
+    remaining = [requests]
+    lock = threading.Lock()
+
+    def worker(n):
+        rng = random.Random(rng_seed + n)
+        workload = Workload(shape, rng)
+        client = app.test_client()
+        # one warm-up login per thread for the token-carrying requests
+        resp = client.post("/api/auth/login", json={
+            "username": f"student{workload.student_id()}@bench.local", "password": BENCH_PASSWORD,
+        })
+        token = (resp.get_json() or {}).get("access_token")
+
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            op = rng.choices(ops, weights)[0]
+            method, url, kwargs = workload.request(op, token)
+            counter = [0]
+            _queries.set(counter)
+            start = time.perf_counter()
+            resp = client.open(url, method=method, **kwargs)
+            elapsed = time.perf_counter() - start
+            with lock:
+                samples[op].append((elapsed, counter[0], resp.status_code < 400))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+    return build_report(requests, concurrency, wall, samples)
+
+
+def run_async(requests=2000, concurrency=100, mix=None, rng_seed=1):
+    """
+    Replay the mix against the ASGI server (asgi.application) with
+    `concurrency` client coroutines on one event loop; same report as run().
+    Needs requirements-asgi.txt.
+    """
+    import httpx
+    import asgi
+
+    mix = mix or ROLL_CALL_MIX
+    shape = dataset_shape()
+    api.login_ip_limiter.capacity = api.login_account_limiter.capacity = float("inf")
+
+    ops, weights = zip(*mix.items())
+    samples = {op: [] for op in ops}
+    remaining = [requests]
+
+    async def worker(client, n):
+        rng = random.Random(rng_seed + n)
+        workload = Workload(shape, rng)
+        resp = await client.post("/api/auth/login", json={
+            "username": f"student{workload.student_id()}@bench.local", "password": BENCH_PASSWORD,
+        })
+        try:
+            token = resp.json().get("access_token")
+        except ValueError:
+            token = None  # login failed; token-carrying requests will 401
+
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            op = rng.choices(ops, weights)[0]
+            method, url, kwargs = workload.request(op, token)
+            counter = [0]
+            _queries.set(counter)
+            start = time.perf_counter()
+            resp = await client.request(method, url, **kwargs)
+            elapsed = time.perf_counter() - start
+            samples[op].append((elapsed, counter[0], resp.status_code < 400))
+
+    async def main():
+        transport = httpx.ASGITransport(app=asgi.application)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await asyncio.gather(*(worker(client, n) for n in range(concurrency)))
+        await asgi.async_engine.dispose()
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    wall = time.perf_counter() - started
+    return build_report(requests, concurrency, wall, samples)
+
+
+def compare_modes(requests=2000, concurrency=100, wsgi_threads=8, mix=None, seed_args=None):
+    """
+    The same burst through the WSGI app (`wsgi_threads` threads, like one
+    threaded worker) and the ASGI server (`concurrency` coroutines). The
+    database is reseeded with `seed_args` before each mode, so neither
+    inherits rows (e.g. first-time rollup inserts) written by the other.
+    """
+    mix = mix or ROLL_CALL_MIX
+    seed_args = seed_args or {}
+    reports = {}
+    for mode, runner, width in (("wsgi", run, wsgi_threads), ("asgi", run_async, concurrency)):
+        seed_mod.seed(**seed_args)
+        reports[mode] = runner(requests, width, mix)
+    return reports
+
+
+def format_comparison(reports):
+    lines = []
+    for mode, report in reports.items():
+        lines.append(f"[{mode}]")
+        lines.append(format_report(report))
+    wsgi, asgi_ = reports["wsgi"], reports["asgi"]
+    if wsgi["throughput_rps"]:
+        lines.append(f"asgi/wsgi throughput: {asgi_['throughput_rps'] / wsgi['throughput_rps']:.2f}x")
+    return "\n".join(lines)
+
+
+def build_report(requests, concurrency, wall, samples):
+    report = {"requests": requests, "concurrency": concurrency, "seconds": round(wall, 3),
+              "throughput_rps": round(requests / wall, 1) if wall else 0.0, "operations": {}}
+    for op, rows in samples.items():
+        if not rows:
+            continue
+        latencies = sorted(r[0] * 1000 for r in rows)
+        report["operations"][op] = {
+            "n": len(rows),
+            "errors": sum(1 for r in rows if not r[2]),
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "rps": round(len(rows) / wall, 1) if wall else 0.0,
+            "queries_per_request": round(sum(r[1] for r in rows) / len(rows), 2),
+        }
+    return report
+
+
+def compare(report, baseline, tolerance=0.2):
+    """
+    Regressions against a stored report: p95 latency more than `tolerance`
+    above the baseline, or more SQL queries per request.
+    """
+    failures = []
+    for op, base in baseline.get("operations", {}).items():
+        cur = report["operations"].get(op)
+        if cur is None:
+            continue
+        if cur["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            failures.append(f"{op}: p95 {cur['p95_ms']}ms > baseline {base['p95_ms']}ms (+{tolerance:.0%})")
+        if cur["queries_per_request"] > base["queries_per_request"] + 0.5:
+            failures.append(f"{op}: {cur['queries_per_request']} queries/request "
+                            f"> baseline {base['queries_per_request']}")
+    return failures
+
+
+def format_report(report):
+    lines = [
+        f"{report['requests']} requests, concurrency {report['concurrency']}, "
+        f"{report['seconds']}s, {report['throughput_rps']} req/s",
+        f"{'operation':<18}{'n':>7}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'req/s':>9}{'q/req':>8}",
+    ]
+    for op, m in sorted(report["operations"].items()):
+        lines.append(
+            f"{op:<18}{m['n']:>7}{m['errors']:>5}{m['p50_ms']:>10}{m['p95_ms']:>10}"
+            f"{m['p99_ms']:>10}{m['rps']:>9}{m['queries_per_request']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)